@@ -23,6 +23,10 @@ class CliMixin:
     def get_cli(cls) -> click.Group:
         """Build a :mod:`click` CLI main function.
 
+        If a manager of this class is passed as the context object (e.g., with ``main(obj=manager)``), it is used
+        instead of building a new one, and giving the ``--connection`` option as well is an error. Any other context
+        object, e.g., one set by an enclosing group, is replaced by a new manager.
+
         :param Type[AbstractManager] cls: A Manager class
         :return: The main function for click
         """
@@ -35,6 +39,9 @@ class CliMixin:
             """Bio2BEL CLI."""
             logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
             logging.getLogger('bio2bel.utils').setLevel(logging.WARNING)
-            ctx.obj = cls(connection=connection)
+            if not isinstance(ctx.obj, cls):
+                ctx.obj = cls(connection=connection)
+            elif ctx.get_parameter_source('connection') is not click.core.ParameterSource.DEFAULT:
+                raise click.UsageError('--connection can not be given when a manager is passed as the context object')
 
         return main
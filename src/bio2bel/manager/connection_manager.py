@@ -40,7 +40,8 @@ class ConnectionManager:
     def __init__(self, connection: Optional[str] = None, engine=None, session=None, **kwargs):
         """Build an abstract manager from either a connection or an engine/session.
 
-        The remaining keyword arguments are passed to :func:`build_engine_session`.
+        If only an engine is given, a session is built for it. The remaining keyword arguments are passed to
+        :func:`build_engine_session` or :func:`build_session`.
 
         :param connection:
         :param engine:
@@ -57,6 +58,9 @@ class ConnectionManager:
 
             engine, session = build_engine_session(connection=connection, **kwargs)
 
+        elif session is None:
+            session = build_session(engine, **kwargs)
+
         self.engine = engine
         self.session = session
 
@@ -97,6 +101,17 @@ class ConnectionManager:
         return f'<{self.module_name.capitalize()}Manager url={self.engine.url}>'
 
 
+def build_engine(connection: str, echo: bool = False, **kwargs):
+    """Build an engine.
+
+    :param connection: An RFC-1738 database connection string
+    :param echo: Turn on echoing SQL
+    :param kwargs: Keyword arguments are passed through to :func:`sqlalchemy.create_engine`, e.g., a ``poolclass``
+    :rtype: sqlalchemy.engine.Engine
+    """
+    return create_engine(connection, echo=echo, **kwargs)
+
+
 def build_engine_session(
     connection: str,
     echo: bool = False,
@@ -114,6 +129,33 @@ def build_engine_session(
     :param expire_on_commit: Defaults to False if not specified in kwargs or configuration.
     :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
     :rtype: tuple[Engine,Session]
+    """
+    engine = build_engine(connection, echo=echo)
+    session = build_session(
+        engine,
+        autoflush=autoflush,
+        autocommit=autocommit,
+        expire_on_commit=expire_on_commit,
+        scopefunc=scopefunc,
+    )
+    return engine, session
+
+
+def build_session(
+    engine,
+    autoflush: Optional[bool] = None,
+    autocommit: Optional[bool] = None,
+    expire_on_commit: Optional[bool] = None,
+    scopefunc=None,
+):
+    """Build a session for an existing engine.
+
+    :param engine: A SQLAlchemy engine or connection to bind the session to
+    :param autoflush: Defaults to True if not specified in kwargs or configuration.
+    :param autocommit: Defaults to False if not specified in kwargs or configuration.
+    :param expire_on_commit: Defaults to False if not specified in kwargs or configuration.
+    :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+    :rtype: sqlalchemy.orm.scoped_session
 
     From the Flask-SQLAlchemy documentation:
 
@@ -123,8 +165,6 @@ def build_engine_session(
     created and removed with the request/response cycle, and should be fine
     in most cases.
     """
-    engine = create_engine(connection, echo=echo)
-
     autoflush = autoflush if autoflush is not None else False
     autocommit = autocommit if autocommit is not None else False
     expire_on_commit = expire_on_commit if expire_on_commit is not None else True
@@ -145,4 +185,4 @@ def build_engine_session(
         scopefunc=scopefunc,
     )
 
-    return engine, session
+    return session
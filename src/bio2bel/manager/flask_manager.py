@@ -70,6 +70,12 @@ class FlaskMixin(ConnectionManager, CliMixin):
         if not hasattr(self, 'flask_admin_models') or not self.flask_admin_models:
             raise Bio2BELMissingModelsError('FlaskMixin requires the class variable "flask_admin_models".')
 
+        if isinstance(self.flask_admin_models, (list, tuple)):
+            for flask_admin_model in self.flask_admin_models:
+                if isinstance(flask_admin_model, tuple) and len(flask_admin_model) != 2:
+                    raise TypeError(f'flask_admin_models entries should be models or (model, view) 2-tuples: '
+                                    f'{flask_admin_model}')
+
         super().__init__(*args, **kwargs)
 
     def _add_admin(self, app, **kwargs):
@@ -85,10 +91,7 @@ class FlaskMixin(ConnectionManager, CliMixin):
         admin = Admin(app, **kwargs)
 
         for flask_admin_model in self.flask_admin_models:
-            if isinstance(flask_admin_model, tuple):  # assume its a 2 tuple
-                if len(flask_admin_model) != 2:
-                    raise TypeError
-
+            if isinstance(flask_admin_model, tuple):  # checked to be a 2-tuple on instantiation
                 model, view = flask_admin_model
                 admin.add_view(view(model, self.session))
 
@@ -4,17 +4,27 @@
 
 This module has tools for quickly writing unit tests with :mod:`unittest` that involve the usage of a mock data with
 a Bio2BEL manager.
+
+Set the environment variable ``BIO2BEL_KEEP_TEST_DB=1`` to keep the temporary SQLite files after the tests that made
+them finish, e.g., to inspect them.
 """
 
 import logging
 import os
+import sqlite3
 import tempfile
 import unittest
-from typing import Type
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Type
 from unittest import mock
 
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
 from .exc import Bio2BELManagerTypeError, Bio2BELTestMissingManagerError
 from .manager.abstract_manager import AbstractManager
+from .manager.connection_manager import build_engine, build_session
 
 __all__ = [
     'TemporaryConnectionMethodMixin',
@@ -27,29 +37,113 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+#: Serialized in-memory databases after population, keyed by manager class and populate function
+_POPULATED_SNAPSHOTS: Dict[Tuple[Type[AbstractManager], Callable], bytes] = {}
+
+#: :meth:`sqlite3.Connection.serialize` and :meth:`sqlite3.Connection.deserialize` were added in Python 3.11
+_CAN_SNAPSHOT = hasattr(sqlite3.Connection, 'serialize')
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Trade durability for speed on throwaway SQLite test databases."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-20000')
+    cursor.close()
+
+
+def _tune_test_engine(engine) -> None:
+    """Apply :func:`_set_sqlite_pragmas` to the connections an engine makes from now on, if it is SQLite."""
+    if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', _set_sqlite_pragmas):
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+
+
+def _make_temporary_database(directory: Optional[str] = None) -> Tuple[int, str]:
+    """Make a temporary SQLite file, named for the pytest-xdist worker (if any) that owns it."""
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    return tempfile.mkstemp(prefix=f'bio2bel_{worker}_', suffix='.db', dir=directory)
+
+
+def _remove_temporary_database(fd: int, path: str) -> None:
+    """Close a temporary SQLite file and delete it, unless ``BIO2BEL_KEEP_TEST_DB`` is set to 1."""
+    os.close(fd)
+    if os.environ.get('BIO2BEL_KEEP_TEST_DB') == '1':
+        log.info('keeping test database at %s', path)
+    else:
+        os.remove(path)
+
+
+#: Engine keyword arguments that make every checkout share the single connection (and so the single database) of an
+#: in-memory SQLite engine, including across threads. Since the connection is shared, returning a checkout to the pool
+#: must not roll it back, or it would discard the open transaction of a test run with ``rollback_tests``.
+_MEMORY_ENGINE_KWARGS = dict(
+    poolclass=StaticPool,
+    pool_reset_on_return=None,
+    connect_args={'check_same_thread': False},
+)
+
+#: Engines shared by the test classes, keyed by connection string
+_ENGINE_CACHE: Dict[str, Engine] = {}
+
+
+def _get_engine(connection: str, **kwargs) -> Engine:
+    """Get the engine for the connection string shared by the test classes, building it on first use.
+
+    :param kwargs: Keyword arguments are passed to :func:`bio2bel.manager.connection_manager.build_engine` the first
+     time the engine is built
+    """
+    engine = _ENGINE_CACHE.get(connection)
+    if engine is None:
+        engine = _ENGINE_CACHE[connection] = build_engine(connection, **kwargs)
+        _tune_test_engine(engine)
+    return engine
+
+
+def _clear_database(engine) -> None:
+    """Drop all tables in the database, found by reflection."""
+    metadata = MetaData()
+    metadata.reflect(engine)
+    metadata.drop_all(engine)
+
 
 class TemporaryConnectionMethodMixin(unittest.TestCase):
     """Creates a :class:`unittest.TestCase` that has a persistent file for use with SQLite during testing."""
 
+    #: The directory in which the temporary database is created. Defaults to the system's temporary directory.
+    temporary_directory: Optional[str] = None
+
     def setUp(self):
         """Create a temporary file to use as a persistent database throughout tests in this class."""
         super().setUp()
 
-        self.fd, self.path = tempfile.mkstemp()
+        self.fd, self.path = _make_temporary_database(self.temporary_directory)
         self.connection = 'sqlite:///' + self.path
         log.info('test database at %s', self.connection)
 
     def tearDown(self):
         """Close the connection to the database and removes the files created for it."""
-        os.close(self.fd)
-        os.remove(self.path)
+        _remove_temporary_database(self.fd, self.path)
 
 
 class TemporaryConnectionMixin(unittest.TestCase):
-    """Creates a :class:`unittest.TestCase` that has a persistent file for use with SQLite during testing."""
+    """Creates a :class:`unittest.TestCase` that has a persistent file for use with SQLite during testing.
+
+    Set the class variable ``use_memory_db`` to use an in-memory SQLite database instead. It is only reachable
+    through the class variable ``engine``, since every engine built from the connection string ``sqlite://`` gets
+    its own, empty database. One engine is shared by all such classes in a process and emptied for each class.
+    """
 
     fd, path = None, None
     connection = None
+    engine = None
+
+    #: The directory in which the temporary database is created. Defaults to the system's temporary directory.
+    temporary_directory: Optional[str] = None
+
+    #: Should an in-memory database be used instead of a temporary file?
+    use_memory_db: bool = False
 
     @classmethod
     def setUpClass(cls):
@@ -60,15 +154,25 @@ class TemporaryConnectionMixin(unittest.TestCase):
         """
         super().setUpClass()
 
-        cls.fd, cls.path = tempfile.mkstemp()
-        cls.connection = 'sqlite:///' + cls.path
+        if cls.use_memory_db:
+            cls.connection = 'sqlite://'
+            cls.engine = _get_engine(cls.connection, **_MEMORY_ENGINE_KWARGS)
+            cls._reset_memory_db()
+        else:
+            cls.fd, cls.path = _make_temporary_database(cls.temporary_directory)
+            cls.connection = 'sqlite:///' + cls.path
         log.info('test database at %s', cls.connection)
 
+    @classmethod
+    def _reset_memory_db(cls) -> None:
+        """Empty the shared in-memory database of anything left by a previous class."""
+        _clear_database(cls.engine)
+
     @classmethod
     def tearDownClass(cls):
         """Close the connection to the database and removes the files created for it."""
-        os.close(cls.fd)
-        os.remove(cls.path)
+        if not cls.use_memory_db:
+            _remove_temporary_database(cls.fd, cls.path)
 
 
 class MockConnectionMixin(TemporaryConnectionMixin):
@@ -112,6 +216,7 @@ class AbstractTemporaryCacheMethodMixin(TemporaryConnectionMethodMixin):
         super().setUp()
 
         self.manager = self.Manager(connection=self.connection)
+        _tune_test_engine(self.manager.engine)
         self.populate()
 
     def tearDown(self):
@@ -131,11 +236,41 @@ class AbstractTemporaryCacheClassMixin(TemporaryConnectionMixin):
 
     Requires the class variable ``Manager`` to be overriden with the class corresponding to the manager to be used that
     is a subclass of :class:`bio2bel.AbstractManager`.
+
+    With ``use_memory_db`` and ``snapshot_populated``, the database populated by the first class with a given
+    ``Manager`` and ``populate`` function is snapshotted (on Python 3.11+) and the snapshot is kept for the rest of the
+    process. Later classes with the same pair get their database restored from it and their ``populate`` is *not*
+    called, so only opt in for classes whose ``populate`` does nothing but fill the database.
+
+    With ``rollback_tests``, each test runs with the manager's session joined to a transaction that is rolled back
+    afterwards, so tests can write to the class's populated database without affecting each other. Tests that change
+    the schema (e.g., with :meth:`bio2bel.AbstractManager.drop_all`) should leave it off.
+
+    A ``Manager`` of the wrong type is reported when the subclass is defined. A missing one is only reported by
+    :meth:`setUpClass`, so intermediate base classes can leave it unset.
     """
 
     Manager: Type[AbstractManager] = ...
     manager: Manager
 
+    #: Should everything each test does to the database be rolled back afterwards?
+    rollback_tests: bool = False
+
+    #: Should the populated in-memory database be snapshotted and restored instead of calling ``populate`` again?
+    snapshot_populated: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Check the ``Manager`` class variable, if it's been set, when a subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        if cls.Manager is not ...:
+            cls._check_manager_type()
+
+    @classmethod
+    def _check_manager_type(cls) -> None:
+        """Raise an error if the ``Manager`` class variable isn't a subclass of :class:`bio2bel.AbstractManager`."""
+        if not isinstance(cls.Manager, type) or not issubclass(cls.Manager, AbstractManager):
+            raise Bio2BELManagerTypeError('Manager must be a subclass of bio2bel.AbstractManager')
+
     @classmethod
     def setUpClass(cls):
         """Set up the class with the given manager and allows an optional populate hook to be overridden."""
@@ -143,13 +278,74 @@ class AbstractTemporaryCacheClassMixin(TemporaryConnectionMixin):
             raise Bio2BELTestMissingManagerError('Must override class variable "Manager" with subclass of '
                                                  'bio2bel.AbstractManager')
 
-        if not issubclass(cls.Manager, AbstractManager):
-            raise Bio2BELManagerTypeError('Manager must be a subclass of bio2bel.AbstractManager')
+        cls._check_manager_type()
 
         super().setUpClass()
 
-        cls.manager = cls.Manager(connection=cls.connection)
-        cls.populate()
+        if not cls.use_memory_db:
+            cls.manager = cls.Manager(connection=cls.connection)
+            _tune_test_engine(cls.manager.engine)
+            cls.populate()
+            return
+
+        cls.manager = cls.Manager(engine=cls.engine)
+
+        if not cls.snapshot_populated:
+            cls.populate()
+            return
+
+        key = cls._get_snapshot_key()
+        if key not in _POPULATED_SNAPSHOTS:
+            cls.populate()
+            if _CAN_SNAPSHOT:
+                _POPULATED_SNAPSHOTS[key] = cls._get_dbapi_connection().serialize()
+
+    @classmethod
+    def _get_snapshot_key(cls) -> Tuple[Type[AbstractManager], Callable]:
+        """Get the key of this class's populated database in :data:`_POPULATED_SNAPSHOTS`."""
+        return cls.Manager, cls.populate.__func__
+
+    @classmethod
+    def _reset_memory_db(cls) -> None:
+        """Restore the populated database from a snapshot if there is one, otherwise empty it.
+
+        Restoring overwrites the whole database, so there's no need to drop the previous class's tables first.
+        """
+        snapshot = _POPULATED_SNAPSHOTS.get(cls._get_snapshot_key()) if cls.snapshot_populated else None
+        if snapshot is None:
+            super()._reset_memory_db()
+        else:
+            log.info('restoring populated %s database from snapshot', cls.Manager.module_name)
+            cls._get_dbapi_connection().deserialize(snapshot)
+
+    def setUp(self):
+        """Join the manager's session to a transaction that is rolled back after the test, if enabled."""
+        super().setUp()
+
+        if self.rollback_tests:
+            self._class_session = self.manager.session
+            self._test_connection = self.manager.engine.connect()
+            self._test_transaction = self._test_connection.begin()
+            self.manager.session = build_session(self._test_connection)
+
+    def tearDown(self):
+        """Roll back everything done in the test and restore the class's session, if enabled."""
+        if self.rollback_tests:
+            self.manager.session.remove()
+            self._test_transaction.rollback()
+            self._test_connection.close()
+            self.manager.session = self._class_session
+
+        super().tearDown()
+
+    @classmethod
+    def _get_dbapi_connection(cls) -> sqlite3.Connection:
+        """Get the single DBAPI connection behind the in-memory database's static pool."""
+        fairy = cls.engine.raw_connection()
+        try:
+            return fairy.connection
+        finally:
+            fairy.close()
 
     @classmethod
     def tearDownClass(cls):
@@ -165,10 +361,15 @@ class AbstractTemporaryCacheClassMixin(TemporaryConnectionMixin):
         """
 
 
+@lru_cache()
 def make_temporary_cache_class_mixin(
     manager_cls: Type[AbstractManager],
 ) -> Type[AbstractTemporaryCacheClassMixin]:  # noqa: D202
-    """Build a testing class that has a Bio2BEL manager instance ready to go."""
+    """Build a testing class that has a Bio2BEL manager instance ready to go.
+
+    The class is built once per manager class and shared by all callers, so set class variables on a subclass of it
+    rather than on the class itself.
+    """
 
     class TemporaryCacheClassMixin(AbstractTemporaryCacheClassMixin):
         Manager = manager_cls
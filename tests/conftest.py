@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Shared :mod:`pytest` fixtures for the Bio2BEL tests.
+
+A single in-memory SQLite database is built once per test session.
+
+The file-backed databases made by the :mod:`bio2bel.testing` mixins are all put in one directory per session. Point
+``TMPDIR`` at a RAM-backed file system (e.g., ``/dev/shm``) to keep them off the disk.
+"""
+
+from unittest import mock
+
+import pytest
+
+from bio2bel.manager.connection_manager import build_engine
+from bio2bel.models import Base
+from bio2bel.testing import (
+    TemporaryConnectionMethodMixin, TemporaryConnectionMixin, _MEMORY_ENGINE_KWARGS, _tune_test_engine,
+)
+from tests.constants import Manager, TestBase
+
+
+#: The metadata of all tables used in the tests
+METADATA = (Base.metadata, TestBase.metadata)
+
+
+def _create_all(engine) -> None:
+    for metadata in METADATA:
+        metadata.create_all(engine)
+
+
+def _drop_all(engine) -> None:
+    for metadata in METADATA:
+        metadata.drop_all(engine)
+
+
+def _delete_all(engine) -> None:
+    """Empty all of the test tables that currently exist."""
+    with engine.begin() as conn:
+        for metadata in METADATA:
+            for table in reversed(metadata.sorted_tables):
+                if engine.dialect.has_table(conn, table.name):
+                    conn.execute(table.delete())
+
+
+@pytest.fixture(scope='session', autouse=True)
+def sqlite_directory(tmp_path_factory):
+    """Create the temporary databases of the :mod:`bio2bel.testing` mixins in one directory for the session."""
+    directory = str(tmp_path_factory.mktemp('bio2bel'))
+    with mock.patch.object(TemporaryConnectionMethodMixin, 'temporary_directory', directory), \
+            mock.patch.object(TemporaryConnectionMixin, 'temporary_directory', directory):
+        yield directory
+
+
+@pytest.fixture(scope='session')
+def engine():
+    """Build one in-memory SQLite database with the full test schema for the whole session."""
+    rv = build_engine('sqlite://', **_MEMORY_ENGINE_KWARGS)
+    _tune_test_engine(rv)
+    _create_all(rv)
+    yield rv
+    rv.dispose()
+
+
+@pytest.fixture
+def clean_db(engine):
+    """Yield the shared engine with its tables emptied, keeping the schema.
+
+    The tables are emptied again afterwards so rows committed by the test can't leak into other tests.
+    """
+    _delete_all(engine)
+    yield engine
+    _delete_all(engine)
+
+
+@pytest.fixture
+def dropped_db(engine):
+    """Yield the shared engine for a test that drops tables, then rebuild the schema."""
+    yield engine
+    _drop_all(engine)
+    _create_all(engine)
+
+
+@pytest.fixture
+def manager(clean_db):
+    """Yield a test manager that commits to the shared database."""
+    return Manager(engine=clean_db)
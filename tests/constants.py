@@ -3,12 +3,13 @@
 """Testing constants and utilities for Bio2BEL."""
 
 import logging
-from typing import List, Mapping, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Type
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, func, select
 from sqlalchemy.ext.declarative import declarative_base
 
 from bio2bel.manager.abstract_manager import AbstractManager
+from bio2bel.manager.connection_manager import ConnectionManager, build_session
 
 log = logging.getLogger(__name__)
 
@@ -19,6 +20,14 @@ TEST_MODEL_ID_FORMAT = 'MODEL:{}'  # noqa:FS003
 TEST_MODEL_NAME_FORMAT = '{0}{0}{0}{0}{0}'  # noqa:FS003
 
 
+def make_test_model_row(model_id: int) -> Dict[str, str]:
+    """Make the column values of the test model with the given integer identifier."""
+    return {
+        'test_id': TEST_MODEL_ID_FORMAT.format(model_id),
+        'name': TEST_MODEL_NAME_FORMAT.format(model_id),
+    }
+
+
 class Model(TestBase):
     """A test model."""
 
@@ -35,10 +44,7 @@ class Model(TestBase):
 
         :rtype: Model
         """
-        return Model(
-            test_id=TEST_MODEL_ID_FORMAT.format(test_id),
-            name=TEST_MODEL_NAME_FORMAT.format(test_id),
-        )
+        return Model(**make_test_model_row(test_id))
 
 
 class Manager(AbstractManager):
@@ -46,6 +52,18 @@ class Manager(AbstractManager):
 
     module_name = 'test'
 
+    #: The rows inserted by :meth:`populate`, built once
+    _POPULATE_ROWS = [
+        make_test_model_row(model_id)
+        for model_id in range(NUMBER_TEST_MODELS)
+    ]
+
+    #: The Core insert used by :meth:`populate`. It's built once and run as one executemany over all rows
+    _POPULATE_INSERT = Model.__table__.insert()
+
+    #: The statement used by :meth:`count_model`, built once. It counts the table directly instead of a subquery
+    _COUNT_STATEMENT = select([func.count()]).select_from(Model.__table__)
+
     def __init__(self, *args, **kwargs):
         """Instantiate the manager."""
         super().__init__(*args, **kwargs)
@@ -61,9 +79,17 @@ class Manager(AbstractManager):
         """Get a model if it exists by its identifier."""
         return self.session.query(Model).filter(Model.test_id == test_id).one_or_none()
 
+    def get_models_by_model_ids(self, test_ids: Iterable[str]) -> Mapping[str, Model]:
+        """Get the models that exist for the given identifiers with a single query."""
+        query = self.session.query(Model).filter(Model.test_id.in_(test_ids))
+        return {
+            model.test_id: model
+            for model in query
+        }
+
     def count_model(self) -> int:
         """Count the test model."""
-        return self._count_model(Model)
+        return self.session.execute(self._COUNT_STATEMENT).scalar()
 
     def list_model(self) -> List[Model]:
         """Get all models."""
@@ -75,11 +101,7 @@ class Manager(AbstractManager):
 
     def populate(self, *args, **kwargs) -> None:
         """Add five models to the store."""
-        models = [
-            Model.from_id(model_id)
-            for model_id in range(NUMBER_TEST_MODELS)
-        ]
-        self.session.add_all(models)
+        self.session.execute(self._POPULATE_INSERT, self._POPULATE_ROWS)
         self.session.commit()
 
         if args:
@@ -95,3 +117,8 @@ class Manager(AbstractManager):
         return {
             'models': self.count_model(),
         }
+
+
+def make_manager(manager_cls: Type[ConnectionManager], engine, connection) -> ConnectionManager:
+    """Instantiate a manager whose session is joined to the given connection's external transaction."""
+    return manager_cls(engine=engine, session=build_session(connection))
@@ -2,40 +2,45 @@
 
 """Tests the CLI generation utilities."""
 
+import pytest
 from click.testing import CliRunner
 from sqlalchemy.exc import OperationalError
 
-from bio2bel.testing import MockConnectionMixin
 from tests.constants import Manager
 
 
-class TestCli(MockConnectionMixin):
+class TestCli:
     """Tests the CLI generator."""
 
-    def setUp(self):
-        """Set up a CliRunner and an accompanying CLI for each test."""
-        self.runner = CliRunner()
-        self.main = Manager.get_cli()
-
-    def test_populate(self):
-        """Test the population function can be run."""
-        args = [
-            '--connection',
-            self.connection,
-            'populate',
-        ]
-        self.runner.invoke(self.main, args)
-
-        manager = Manager(connection=self.connection)
-        self.assertEqual(5, manager.count_model())
-
-        args = [
-            '--connection',
-            self.connection,
-            'drop',
-            '--yes',
-        ]
-        self.runner.invoke(self.main, args)
-
-        with self.assertRaises(OperationalError):
+    runner = CliRunner()
+    main = Manager.get_cli()
+
+    def test_populate_unit(self, manager, dropped_db):
+        """Test the functions behind the populate and drop commands."""
+        manager.populate()
+        assert 5 == manager.count_model()
+
+        manager.drop_all()
+
+        with pytest.raises(OperationalError):
             manager.count_model()
+
+    def test_cli_smoke(self, manager):
+        """Test the population function can be run through the CLI."""
+        result = self.runner.invoke(self.main, ['populate'], obj=manager)
+        assert 0 == result.exit_code, result.output
+        assert 5 == manager.count_model()
+
+    def test_cli_connection_with_manager(self, manager):
+        """Test giving a connection is an error when the CLI is passed a manager."""
+        result = self.runner.invoke(self.main, ['--connection', 'sqlite://', 'populate'], obj=manager)
+        assert 2 == result.exit_code, result.output
+        assert 'context object' in result.output
+        assert 0 == manager.count_model()
+
+    def test_cli_foreign_context_object(self, tmp_path):
+        """Test a manager is built when the CLI is passed a context object that isn't one, e.g., by a parent group."""
+        connection = f'sqlite:///{tmp_path / "test.db"}'
+        result = self.runner.invoke(self.main, ['--connection', connection, 'populate'], obj={'parent': 'state'})
+        assert 0 == result.exit_code, result.output
+        assert 5 == Manager(connection=connection).count_model()
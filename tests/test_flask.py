@@ -2,12 +2,20 @@
 
 """Tests the Flask web application generation utilities."""
 
-from flask_admin.contrib.sqla import ModelView
+import pytest
 
 from bio2bel.exc import Bio2BELMissingModelsError
 from bio2bel.manager.flask_manager import FlaskMixin
-from bio2bel.testing import TemporaryConnectionMethodMixin
-from tests.constants import Manager, Model
+from tests.constants import Manager, Model, make_manager
+
+sqla = pytest.importorskip('flask_admin.contrib.sqla')
+
+pytestmark = pytest.mark.flask
+
+
+MODEL_NAME_BYTES = Model.__name__.encode('utf-8')
+#: The canonical Flask-Admin URL of the model's list view, which avoids following a redirect
+MODEL_URL = f'/{Model.__name__.lower()}/'
 
 
 class WrongFlaskTestManager(FlaskMixin):
@@ -16,16 +24,22 @@ class WrongFlaskTestManager(FlaskMixin):
     module_name = 'test'
 
 
+class TruncatedModelView(sqla.ModelView):
+    """A truncated Flask Admin view."""
+
+    column_exclude_list = ['test_id']
+
+
 class FlaskTestManager(FlaskMixin, Manager):
     """Extends the test Manager for generating a Flask application."""
 
     flask_admin_models = [Model]
 
 
-class TruncatedModelView(ModelView):
-    """A truncated Flask Admin view."""
+class FlaskSingleModelTestManager(Manager, FlaskMixin):
+    """Extends the test Manager with a single model instead of a list."""
 
-    column_exclude_list = ['test_id']
+    flask_admin_models = Model
 
 
 class FlaskTestViewManager(Manager, FlaskMixin):
@@ -40,57 +54,90 @@ class FlaskFailureTestViewManager(Manager, FlaskMixin):
     flask_admin_models = [(Model, TruncatedModelView, 'junk!')]
 
 
-class TestFlask(TemporaryConnectionMethodMixin):
+def _populate_and_check(manager) -> None:
+    """Populate the manager and check that it worked.
+
+    The not-populated to populated transition itself is covered by :mod:`tests.test_actions`.
+    """
+    manager.populate()
+    assert manager.is_populated()
+
+
+@pytest.fixture(scope='class')
+def admin_client(request, engine):
+    """Build a populated manager and its Flask-Admin test client once per class.
+
+    The manager class is looked up with the ``manager_cls`` class variable of the requesting test class.
+    """
+    connection = engine.connect()
+    trans = connection.begin()
+    try:
+        manager = make_manager(request.cls.manager_cls, engine, connection)
+
+        _populate_and_check(manager)
+
+        app = manager.get_flask_admin_app()
+        yield app.test_client()
+    finally:
+        trans.rollback()
+        connection.close()
+
+
+class TestFlask:
     """Tests Flask application generation."""
 
     def test_missing_models(self):
         """Test exceptions are thrown properly for an improperly implemented AbstractManager."""
-        self.assertFalse(hasattr(WrongFlaskTestManager, 'flask_admin_models'))
+        assert not hasattr(WrongFlaskTestManager, 'flask_admin_models')
 
-        with self.assertRaises(Bio2BELMissingModelsError):
-            WrongFlaskTestManager(connection=self.connection)
+        with pytest.raises(Bio2BELMissingModelsError):
+            WrongFlaskTestManager(connection='sqlite://')
 
-    def test_app(self):
-        """Test the successful generation of a flask application."""
-        manager = FlaskTestManager(connection=self.connection)
+    def test_single_model(self):
+        """Test a manager with a single model instead of a list can be instantiated."""
+        manager = FlaskSingleModelTestManager(connection='sqlite://')
+        assert Model is manager.flask_admin_models
 
-        self.assertFalse(manager.is_populated())
-        manager.populate()
-        self.assertTrue(manager.is_populated())
 
-        app = manager.get_flask_admin_app()
-        client = app.test_client()
+class AppHomeMixin:
+    """Tests for the home page of a successfully generated flask application."""
 
-        home_rv = client.get('/')
-        self.assertIn(Model.__name__.encode('utf-8'), home_rv.data)
+    def test_app_home(self, admin_client):
+        """Test the home page lists the model."""
+        home_rv = admin_client.get('/')
+        assert MODEL_NAME_BYTES in home_rv.data
 
-        rv = client.get(f'/{Model.__name__.lower()}', follow_redirects=True)
-        self.assertIn(b'MODEL:1', rv.data)
 
-    def test_app_truncated_view(self):
-        """Test the ability to define tuple views."""
-        manager = FlaskTestViewManager(connection=self.connection)
+class TestApp(AppHomeMixin):
+    """Tests a flask application with the default views."""
 
-        self.assertFalse(manager.is_populated())
-        manager.populate()
-        self.assertTrue(manager.is_populated())
+    manager_cls = FlaskTestManager
+
+    def test_app(self, admin_client):
+        """Test the successful generation of a flask application."""
+        rv = admin_client.get(MODEL_URL)
+        assert 200 == rv.status_code
+        assert b'MODEL:1' in rv.data
 
-        app = manager.get_flask_admin_app()
-        client = app.test_client()
 
-        home_rv = client.get('/')
-        home_data = home_rv.data.decode('utf-8')
-        self.assertIn(Model.__name__, home_data)
+class TestAppTruncatedView(AppHomeMixin):
+    """Tests a flask application with a tuple view."""
 
-        rv = client.get(f'/{Model.__name__.lower()}', follow_redirects=True)
+    manager_cls = FlaskTestViewManager
+
+    def test_app_truncated_view(self, admin_client):
+        """Test the ability to define tuple views."""
+        rv = admin_client.get(MODEL_URL)
+        assert 200 == rv.status_code
         rv_data = rv.data.decode('utf-8')
-        self.assertNotIn('MODEL:1', rv_data)
-        self.assertIn('1111', rv_data)
+        assert 'MODEL:1' not in rv_data
+        assert '1111' in rv_data
+
+
+class TestAppViewFailure:
+    """Tests a manager with a malformed tuple view."""
 
     def test_app_view_failure(self):
         """Test the ability to define tuple views."""
-        manager = FlaskFailureTestViewManager(connection=self.connection)
-        manager.populate()
-
-        with self.assertRaises(TypeError):
-            manager.get_flask_admin_app()
+        with pytest.raises(TypeError):
+            FlaskFailureTestViewManager(connection='sqlite://')
@@ -4,6 +4,7 @@
 
 import unittest
 
+import pytest
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -11,11 +12,37 @@ import tests.constants
 from bio2bel import AbstractManager
 from bio2bel.exc import Bio2BELMissingNameError, Bio2BELModuleCaseError
 from bio2bel.models import Action
-from bio2bel.testing import AbstractTemporaryCacheClassMixin, MockConnectionMixin, TemporaryConnectionMethodMixin
-from tests.constants import NUMBER_TEST_MODELS
+from bio2bel.testing import AbstractTemporaryCacheClassMixin, MockConnectionMixin
+from tests.constants import NUMBER_TEST_MODELS, TEST_MODEL_ID_FORMAT
 
+#: A declarative base shared by the incomplete managers. No models are attached, so there are no mapper collisions.
+_BASE = declarative_base()
 
-class TestManagerFailures(TemporaryConnectionMethodMixin):
+
+class NamelessManager(AbstractManager):
+    """An improperly implemented AbstractManager that is missing the module_name class variable."""
+
+    @property
+    def _base(self):
+        return _BASE
+
+    def is_populated(self):
+        """Check if the database is already populated."""
+
+    def populate(self):
+        """Populate the database."""
+
+    def summarize(self):
+        """Summarize the database."""
+
+
+class UpperCaseManager(NamelessManager):
+    """A test manager that checks the module name is lower cased."""
+
+    module_name = 'TESTOMG'
+
+
+class TestManagerFailures:
     """Test improperly implement AbstractManager."""
 
     def test_missing_all_abstract(self):
@@ -23,22 +50,20 @@ class TestManagerFailures(TemporaryConnectionMethodMixin):
         class Manager(AbstractManager):
             """An incompletely implement AbstractManager."""
 
-        with self.assertRaises(TypeError):  # cant's instantiate abstract class
-            Manager(self.connection)
+        with pytest.raises(TypeError):  # cant's instantiate abstract class
+            Manager('sqlite://')
 
     def test_fail_instantiation_2(self):
         """Test that the abstract class can't be instantiated."""
-        base = declarative_base()
-
         class Manager(AbstractManager):
             """An incompletely implement AbstractManager."""
 
             @property
             def _base(self):
-                return base
+                return _BASE
 
-        with self.assertRaises(TypeError):
-            Manager(connection=self.connection)
+        with pytest.raises(TypeError):
+            Manager(connection='sqlite://')
 
     def test_fail_instantiation_3(self):
         """Test that the abstract class can't be instantiated."""
@@ -48,62 +73,17 @@ class TestManagerFailures(TemporaryConnectionMethodMixin):
             def populate(self):
                 """Populate the database."""
 
-        with self.assertRaises(TypeError):
-            Manager(connection=self.connection)
-
-    def test_undefined_module_name(self):
-        """Test error thrown if module name isn't set."""
-        base = declarative_base()
+        with pytest.raises(TypeError):
+            Manager(connection='sqlite://')
 
-        class Manager(AbstractManager):
-            """An improperly implemented AbstractManager that is missing the module_name class variable."""
-
-            @property
-            def _base(self):
-                return base
-
-            def is_populated(self):
-                """Check if the database is already populated."""
-                pass
-
-            def populate(self):
-                """Populate the database."""
-                pass
-
-            def summarize(self):
-                """Summarize the database."""
-                pass
-
-        with self.assertRaises(Bio2BELMissingNameError):
-            Manager(connection=self.connection)
-
-    def test_module_name_case(self):
-        """Test error thrown if module name is weird case."""
-        base = declarative_base()
-
-        class Manager(AbstractManager):
-            """A test manager that checks the module name is lower cased."""
-
-            module_name = 'TESTOMG'
-
-            @property
-            def _base(self):
-                return base
-
-            def is_populated(self):
-                """Check if the database is already populated."""
-                pass
-
-            def populate(self):
-                """Populate the database."""
-                pass
-
-            def summarize(self):
-                """Summarize the database."""
-                pass
-
-        with self.assertRaises(Bio2BELModuleCaseError):
-            Manager(connection=self.connection)
+    @pytest.mark.parametrize(('manager_cls', 'exc'), [
+        (NamelessManager, Bio2BELMissingNameError),
+        (UpperCaseManager, Bio2BELModuleCaseError),
+    ])
+    def test_module_name(self, manager_cls, exc):
+        """Test errors thrown if the module name isn't set or is the wrong case."""
+        with pytest.raises(exc):
+            manager_cls(connection='sqlite://')
 
 
 class TestConnectionDropping(MockConnectionMixin, AbstractTemporaryCacheClassMixin):
@@ -126,6 +106,12 @@ class TestConnectionLoading(AbstractTemporaryCacheClassMixin):
     """Tests the connection is loaded properly."""
 
     Manager = tests.constants.Manager
+    use_memory_db = True
+
+    @classmethod
+    def populate(cls):
+        """Populate the database once for all tests in this class."""
+        cls.manager.populate()
 
     def test_connection(self):
         """Test the type of the connection."""
@@ -142,18 +128,19 @@ class TestConnectionLoading(AbstractTemporaryCacheClassMixin):
 
     def test_get_missing_model(self):
         """Test population."""
-        self.assertFalse(self.manager.is_populated())
-        self.manager.populate()
         self.assertTrue(self.manager.is_populated())
 
         self.assertEqual(NUMBER_TEST_MODELS, self.manager.count_model())
 
-        self.assertIsNone(self.manager.get_model_by_model_id(0))
-        self.assertIsNone(self.manager.get_model_by_model_id(1))
-        self.assertIsNone(self.manager.get_model_by_model_id(2))
-        self.assertIsNone(self.manager.get_model_by_model_id(3))
-        self.assertIsNone(self.manager.get_model_by_model_id(4))
-        self.assertIsNone(self.manager.get_model_by_model_id(150))
+        model_ids = [TEST_MODEL_ID_FORMAT.format(i) for i in range(NUMBER_TEST_MODELS)]
+        missing_model_id = TEST_MODEL_ID_FORMAT.format(150)
+
+        models = self.manager.get_models_by_model_ids([*model_ids, missing_model_id])
+        self.assertEqual(set(model_ids), set(models))
+        for model_id, model in models.items():
+            self.assertEqual(model_id, model.test_id)
+        self.assertNotIn(missing_model_id, models)
+        self.assertIsNone(self.manager.get_model_by_model_id(missing_model_id))
 
 
 if __name__ == '__main__':
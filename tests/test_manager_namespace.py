@@ -7,11 +7,12 @@ import logging
 from click.testing import CliRunner
 
 import pybel
+import tests.constants
 from bio2bel.manager.namespace_manager import BELNamespaceManagerMixin, Bio2BELMissingNamespaceModelError
-from bio2bel.testing import AbstractTemporaryCacheMethodMixin, MockConnectionMixin, TemporaryConnectionMethodMixin
+from bio2bel.testing import AbstractTemporaryCacheClassMixin, MockConnectionMixin, TemporaryConnectionMethodMixin
 from pybel import BELGraph
 from pybel.manager.models import Namespace, NamespaceEntry
-from tests.constants import Manager, Model, NUMBER_TEST_MODELS, TEST_MODEL_ID_FORMAT, TEST_MODEL_NAME_FORMAT
+from tests.constants import Manager, Model, NUMBER_TEST_MODELS, make_test_model_row
 
 log = logging.getLogger(__name__)
 
@@ -63,14 +64,20 @@ class TestFailure(TemporaryConnectionMethodMixin):
             _TestManager(connection=self.connection)
 
 
-class TestAwesome(AbstractTemporaryCacheMethodMixin):
-    """Tests for namespace management."""
+class TestAwesome(AbstractTemporaryCacheClassMixin):
+    """Tests for namespace management.
+
+    The database (including PyBEL's tables) is built and populated once for the class. Each test runs in a
+    transaction that is rolled back afterwards, since several of them make namespaces.
+    """
 
     Manager = NamespaceManager
+    rollback_tests = True
 
-    def populate(self):
+    @classmethod
+    def populate(cls):
         """Populate the manager."""
-        self.manager.populate()
+        cls.manager.populate()
 
     def test_namespace_name(self):
         """Test the name generated by the manager."""
@@ -88,20 +95,13 @@ class TestAwesome(AbstractTemporaryCacheMethodMixin):
 
         self.assertEqual(NUMBER_TEST_MODELS, namespace.entries.count())
 
-        em = {
-            entry.identifier: entry
-            for entry in namespace.entries
-        }
-
-        for i in range(NUMBER_TEST_MODELS):
-            model_id = TEST_MODEL_ID_FORMAT.format(i)
-
-            self.assertIn(model_id, em)
-            model = em[model_id]
-
-            self.assertEqual(model_id, model.identifier)
-            self.assertEqual(TEST_MODEL_NAME_FORMAT.format(i), model.name)
-            self.assertEqual(namespace, model.namespace)
+        names = dict(
+            self.manager.session
+            .query(NamespaceEntry.identifier, NamespaceEntry.name)
+            .filter(NamespaceEntry.namespace == namespace)
+        )
+        rows = [make_test_model_row(model_id) for model_id in range(NUMBER_TEST_MODELS)]
+        self.assertEqual({row['test_id']: row['name'] for row in rows}, names)
 
         # TODO fix cascade on namespace to namespace entries
         # self.manager.clear_bel_namespace()
@@ -117,11 +117,11 @@ class TestAwesome(AbstractTemporaryCacheMethodMixin):
 
         _number_to_add = 4
 
-        models = [
-            Model.from_id(model_id)
+        rows = [
+            make_test_model_row(model_id)
             for model_id in range(NUMBER_TEST_MODELS + 1, NUMBER_TEST_MODELS + 1 + _number_to_add)
         ]
-        self.manager.session.add_all(models)
+        self.manager.session.execute(Model.__table__.insert(), rows)
         self.manager.session.commit()
 
         self.manager._update_namespace(namespace)
@@ -137,15 +137,17 @@ class TestAwesome(AbstractTemporaryCacheMethodMixin):
         self.assertIn(self.manager.module_name, graph.annotation_list['bio2bel'])
 
 
-class TestCli(MockConnectionMixin):
+class TestCli(MockConnectionMixin, AbstractTemporaryCacheClassMixin):
     """Tests the CLI for uploading a BEL namespace."""
 
-    def setUp(self):
-        """Set up a CliRunner and an accompanying CLI for each test."""
-        self.runner = CliRunner()
-        self.main = NamespaceManager.get_cli()
-        self.manager = Manager(connection=self.connection)
-        self.manager.populate()
+    Manager = tests.constants.Manager
+    runner = CliRunner()
+    main = NamespaceManager.get_cli()
+
+    @classmethod
+    def populate(cls):
+        """Populate the database once for all tests in this class."""
+        cls.manager.populate()
 
     def test_to_bel_namespace(self):
         """Test the population function can be run."""
@@ -2,100 +2,113 @@
 
 """Tests the Bio2BEL testing utilities."""
 
-import unittest
+import os
+from unittest import mock
 
+import pytest
+
+import tests.constants
 from bio2bel.exc import Bio2BELManagerTypeError, Bio2BELTestMissingManagerError
 from bio2bel.testing import (
-    AbstractTemporaryCacheClassMixin, AbstractTemporaryCacheMethodMixin, make_temporary_cache_class_mixin,
+    AbstractTemporaryCacheClassMixin, AbstractTemporaryCacheMethodMixin, _CAN_SNAPSHOT, _make_temporary_database,
+    _remove_temporary_database, make_temporary_cache_class_mixin,
 )
-from tests.constants import Manager
-
+from tests.constants import Manager, Model, NUMBER_TEST_MODELS
 
-class TestMethodCacheBuild(unittest.TestCase):
-    """Tests the instantiation of concrete implementation of the :class:`AbstractManager`."""
+#: The testing base class for the test manager, built once for this module
+_TEMP_CACHE_BASE = make_temporary_cache_class_mixin(Manager)
 
-    def test_missing_manager(self):
-        """Test that an incorrectly built AbstractTemporaryCacheMethodMixin won't run."""
-        class TestMissingManagerMixin(AbstractTemporaryCacheMethodMixin):
-            """An :class:`AbstractTemporaryCacheClassMixin` that is missing the Manager class variable."""
 
-            def test_dummy(self):
-                """Test dummy."""
-                self.assertTrue(True)
+class RandomClass:
+    """This class is not the right type and should throw a Bio2BELManagerTypeError."""
 
-        with self.assertRaises(Bio2BELTestMissingManagerError):
-            m = TestMissingManagerMixin()
-            m.setUp()
 
-    def test_manager_wrong_type(self):
-        """Test that an incorrectly built AbstractTemporaryCacheClassMixin won't run."""
-        class RandomClass(object):
-            """This class is not the right type and should throw a Bio2BELManagerTypeError."""
+class MissingManagerMethodMixin(AbstractTemporaryCacheMethodMixin):
+    """An :class:`AbstractTemporaryCacheMethodMixin` that is missing the Manager class variable."""
 
-        class TestManagerWrongTypeMixin(AbstractTemporaryCacheMethodMixin):
-            """This is a malformed :class:`AbstractTemporaryCacheClassMixin`."""
 
-            Manager = RandomClass
+class WrongManagerMethodMixin(AbstractTemporaryCacheMethodMixin):
+    """An :class:`AbstractTemporaryCacheMethodMixin` with the wrong type of Manager class variable."""
 
-            def test_dummy(self):
-                """This is a dummy test."""
-                self.assertTrue(True)
+    Manager = RandomClass
 
-        with self.assertRaises(Bio2BELManagerTypeError):
-            m = TestManagerWrongTypeMixin()
-            m.setUp()
 
+class MissingManagerClassMixin(AbstractTemporaryCacheClassMixin):
+    """An :class:`AbstractTemporaryCacheClassMixin` that is missing the Manager class variable."""
 
-class TestClassCacheBuild(unittest.TestCase):
-    """Tests the instantiation of concrete implementation of the :class:`AbstractManager`."""
 
-    def test_missing_manager(self):
-        """Test that an incorrectly built AbstractTemporaryCacheClassMixin won't run."""
-        class TestMissingManagerMixin(AbstractTemporaryCacheClassMixin):
-            """An :class:`AbstractTemporaryCacheClassMixin` that is missing the Manager class variable."""
+@pytest.mark.parametrize(('mixin_cls', 'exc'), [
+    (MissingManagerMethodMixin, Bio2BELTestMissingManagerError),
+    (WrongManagerMethodMixin, Bio2BELManagerTypeError),
+])
+def test_method_mixin_invalid(mixin_cls, exc):
+    """Test that an incorrectly built AbstractTemporaryCacheMethodMixin won't run."""
+    with pytest.raises(exc):
+        mixin_cls().setUp()
 
-            def test_dummy(self):
-                """Test dummy."""
-                self.assertTrue(True)
 
-        with self.assertRaises(Bio2BELTestMissingManagerError):
-            TestMissingManagerMixin.setUpClass()
+def test_class_mixin_missing_manager():
+    """Test that an AbstractTemporaryCacheClassMixin without a manager won't run."""
+    with pytest.raises(Bio2BELTestMissingManagerError):
+        MissingManagerClassMixin.setUpClass()
+    assert MissingManagerClassMixin.path is None, 'database should not be made before validation'
 
-    def test_manager_wrong_type(self):
-        """Test that an incorrectly built AbstractTemporaryCacheClassMixin won't run."""
-        class RandomClass(object):
-            """This class is not the right type and should throw a Bio2BELManagerTypeError."""
 
-        class TestManagerWrongTypeMixin(AbstractTemporaryCacheClassMixin):
+def test_class_mixin_manager_wrong_type():
+    """Test that an AbstractTemporaryCacheClassMixin with the wrong type of manager can't be defined."""
+    with pytest.raises(Bio2BELManagerTypeError):
+        class WrongManagerClassMixin(AbstractTemporaryCacheClassMixin):
             """This is a malformed :class:`AbstractTemporaryCacheClassMixin`."""
 
             Manager = RandomClass
 
-            def test_dummy(self):
-                """This is a dummy test."""
-                self.assertTrue(True)
 
-        with self.assertRaises(Bio2BELManagerTypeError):
-            TestManagerWrongTypeMixin.setUpClass()
+@pytest.mark.parametrize(('keep', 'expected_exists'), [('1', True), ('0', False)])
+def test_remove_temporary_database(tmp_path, keep, expected_exists):
+    """Test the temporary database is only kept when ``BIO2BEL_KEEP_TEST_DB`` is set to 1."""
+    fd, path = _make_temporary_database(str(tmp_path))
+    with mock.patch.dict(os.environ, {'BIO2BEL_KEEP_TEST_DB': keep}):
+        _remove_temporary_database(fd, path)
+    assert expected_exists == os.path.exists(path)
+
+
+class TestPopulatedMethod(AbstractTemporaryCacheMethodMixin):
+    """Tests :class:`bio2bel.testing.AbstractTemporaryCacheMethodMixin` populating a fresh database for each test."""
+
+    Manager = tests.constants.Manager
+
+    def populate(self):
+        """Populate the database."""
+        self.manager.populate()
+
+    def test_populated(self):
+        """Test that the correct number of models have been added to the database."""
+        self.assertEqual(NUMBER_TEST_MODELS, self.manager.count_model())
 
 
-class TestTesting(make_temporary_cache_class_mixin(Manager)):
+class TestTesting(_TEMP_CACHE_BASE):
     """Tests :func:`bio2bel.testing.make_temporary_cache_class_mixin`."""
 
+    use_memory_db = True
+
     def test_self(self):
         """Test that this test is an instance of AbstractTemporaryCacheClassMixin."""
         self.assertIsInstance(self, AbstractTemporaryCacheClassMixin)
 
     def test_has_attributes(self):
         """Test class has a manager instance."""
-        self.assertTrue(hasattr(self, 'manager'))
-        self.assertIsNotNone(self.manager)
-        self.assertIsInstance(self.manager, Manager)
+        self.assertIsInstance(getattr(self, 'manager', None), Manager)
+
+    def test_mixin_reused(self):
+        """Test the mixin class is only built once for a given manager class."""
+        self.assertIs(make_temporary_cache_class_mixin(Manager), make_temporary_cache_class_mixin(Manager))
 
 
-class TestPopulated(TestTesting):
+class TestPopulated(_TEMP_CACHE_BASE):
     """Test the :func:`bio2bel.testing.make_temporary_cache_class_mixin`."""
 
+    use_memory_db = True
+
     @classmethod
     def populate(cls):
         """Populate the database."""
@@ -103,10 +116,10 @@ class TestPopulated(TestTesting):
 
     def test_populated(self):
         """Test that the correct number of models have been added to the database."""
-        self.assertEqual(5, self.manager.count_model())
+        self.assertEqual(NUMBER_TEST_MODELS, self.manager.count_model())
 
 
-class TestPopulatedKwargs(TestTesting):
+class TestPopulatedKwargs(TestPopulated):
     """Test the :func:`bio2bel.testing.make_temporary_cache_class_mixin` with kwargs in the populate function."""
 
     @classmethod
@@ -114,6 +127,53 @@ class TestPopulatedKwargs(TestTesting):
         """Populate the database."""
         cls.manager.populate(return_true=True)
 
-    def test_populated(self):
-        """Test that the correct number of models have been added to the database."""
-        self.assertEqual(5, self.manager.count_model())
+
+@pytest.mark.parametrize(('rollback_tests', 'expected_count'), [
+    (False, NUMBER_TEST_MODELS + 1),
+    (True, NUMBER_TEST_MODELS),
+])
+def test_rollback_tests(rollback_tests, expected_count):
+    """Test a write made in a test outlives it, unless ``rollback_tests`` is set."""
+    mixin_cls = type('RollbackMixin', (TestPopulated,), {'rollback_tests': rollback_tests})
+    mixin_cls.setUpClass()
+    try:
+        test = mixin_cls('test_populated')
+        test.setUp()
+        try:
+            test.manager.session.add(Model.from_id(NUMBER_TEST_MODELS))
+            test.manager.session.commit()
+            # an engine-level checkout must not roll back the test's transaction when it's returned to the pool
+            test.manager.create_all()
+            assert NUMBER_TEST_MODELS + 1 == test.manager.count_model()
+        finally:
+            test.tearDown()
+
+        assert expected_count == mixin_cls.manager.count_model()
+    finally:
+        mixin_cls.tearDownClass()
+
+
+@pytest.mark.skipif(not _CAN_SNAPSHOT, reason='snapshots need sqlite3.Connection.serialize (Python 3.11+)')
+@pytest.mark.parametrize(('snapshot_populated', 'expected_calls'), [(True, 1), (False, 2)])
+def test_populated_snapshot(snapshot_populated, expected_calls):
+    """Test a second class with the same populate function is restored from a snapshot instead of populating."""
+    calls = []
+
+    def populate(cls):
+        calls.append(cls)
+        cls.manager.populate()
+
+    base = type('PopulatedMixin', (_TEMP_CACHE_BASE,), {
+        'use_memory_db': True,
+        'snapshot_populated': snapshot_populated,
+        'populate': classmethod(populate),
+    })
+    for name in ('First', 'Second'):
+        mixin_cls = type(name, (base,), {})
+        mixin_cls.setUpClass()
+        try:
+            assert NUMBER_TEST_MODELS == mixin_cls.manager.count_model()
+        finally:
+            mixin_cls.tearDownClass()
+
+    assert expected_calls == len(calls)